@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import logging
 import sys
 from collections.abc import Sequence
@@ -15,10 +16,12 @@ from yolo_ex.models import ExportFormat, ExportRequest
 from yolo_ex.platforms import preflight_for_format
 
 LOGGER = logging.getLogger(__name__)
+_FORMAT_CHOICES: tuple[str, ...] = tuple(fmt.value for fmt in ExportFormat)
 
 
+@functools.cache
 def build_parser() -> argparse.ArgumentParser:
-    """Build the CLI parser."""
+    """Build the CLI parser once; argparse parsers are reusable across ``parse_args`` calls."""
     parser = argparse.ArgumentParser(prog="yolo-ex", description="YOLO model export tool")
     subparsers = parser.add_subparsers(dest="command", required=True)
 
@@ -28,7 +31,7 @@ def build_parser() -> argparse.ArgumentParser:
         "--format",
         "-f",
         required=True,
-        choices=[fmt.value for fmt in ExportFormat],
+        choices=_FORMAT_CHOICES,
         help="Target export format",
     )
     export_parser.add_argument(
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import importlib
+import importlib.util
 import json
 import sys
 from pathlib import Path
@@ -38,13 +40,12 @@ def export_model(request: ExportRequest) -> ExportResult:
         raise ExportExecutionError(f"Ultralytics export failed: {exc}") from exc
 
     output_path = _normalize_output_path(exported)
-    details = {"dry_run": "false", "kwargs": json.dumps(export_kwargs, sort_keys=True)}
     return ExportResult(
         format=request.format,
         input_model=request.model_path,
         output_path=output_path,
         backend="ultralytics",
-        details=details,
+        details={"dry_run": "false"},
     )
 
 
@@ -85,19 +86,22 @@ def build_export_kwargs(request: ExportRequest) -> dict[str, Any]:
     return kwargs
 
 
+@functools.cache
 def _load_yolo_class() -> Any:
+    """Import ``ultralytics.YOLO`` on first use; later calls reuse the loaded class."""
     from ultralytics import YOLO  # type: ignore[attr-defined]
 
     return YOLO
 
 
+@functools.cache
 def _ensure_tensorrt_module_compat() -> None:
     """Alias ``tensorrt_bindings`` to ``tensorrt`` when Jetson omits canonical module."""
-    try:
-        importlib.import_module("tensorrt")
+    # find_spec answers "is it importable?" without running tensorrt's heavy module init.
+    if "tensorrt" in sys.modules or importlib.util.find_spec("tensorrt") is not None:
+        return
+    if importlib.util.find_spec("tensorrt_bindings") is None:
         return
-    except ImportError:
-        pass
 
     try:
         tensorrt_bindings = importlib.import_module("tensorrt_bindings")
@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import functools
 import importlib
+import os
 import platform as py_platform
-from dataclasses import dataclass, field
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from enum import Enum
-from importlib import metadata as importlib_metadata
+from typing import TYPE_CHECKING, NamedTuple
 
-from yolo_ex.platforms import PlatformTarget, detect_platform
+from yolo_ex.platforms import NOCACHE_ENV_VAR, PlatformTarget, detect_platform
+
+if TYPE_CHECKING:
+    from packaging.version import Version
 
 ULTRALYTICS_VERSION = "8.4.14"
 JETSON_TORCH_VERSION = "2.5.0a0+872d972e41.nv24.08"
@@ -26,8 +33,7 @@ class PackageCheckStatus(str, Enum):
     SKIPPED = "skipped"
 
 
-@dataclass(slots=True)
-class PackageCheck:
+class PackageCheck(NamedTuple):
     """Result of checking one package requirement."""
 
     label: str
@@ -39,60 +45,60 @@ class PackageCheck:
     message: str
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class PlatformCheckReport:
     """Complete setup validation result for the current platform."""
 
     platform_target: PlatformTarget
     platform_details: str
     supported: bool
-    checks: list[PackageCheck] = field(default_factory=list)
-    warnings: list[str] = field(default_factory=list)
+    checks: tuple[PackageCheck, ...] = ()
+    warnings: tuple[str, ...] = ()
     ok: bool = False
 
 
 def check_current_platform() -> PlatformCheckReport:
-    """Detect the current platform and validate required package versions."""
+    """Detect the current platform and validate required package versions.
+
+    The report is computed once per process; set ``YOLO_EX_NOCACHE`` or call
+    :func:`clear_platform_check_cache` to rerun every check.
+    """
+    if os.environ.get(NOCACHE_ENV_VAR):
+        _get_distribution_version.cache_clear()
+        return _build_platform_report()
+    return _cached_platform_report()
+
+
+def clear_platform_check_cache() -> None:
+    """Forget the memoized report and package versions, e.g. after installing packages."""
+    _cached_platform_report.cache_clear()
+    _get_distribution_version.cache_clear()
+
+
+@functools.cache
+def _cached_platform_report() -> PlatformCheckReport:
+    return _build_platform_report()
+
+
+def _build_platform_report() -> PlatformCheckReport:
     target = detect_platform()
-    details = f"{py_platform.system()} {py_platform.machine()}"
-    warnings: list[str] = []
+    details = _platform_details()
 
-    if target is PlatformTarget.OTHER:
-        warnings.append(
-            "Unsupported platform for yolo-ex exports. Supported target is Jetson "
-            "(Linux arm64)."
-        )
+    probes = _PLATFORM_PROBES.get(target)
+    if probes is None:
         return PlatformCheckReport(
             platform_target=target,
             platform_details=details,
             supported=False,
-            warnings=warnings,
+            warnings=(
+                "Unsupported platform for yolo-ex exports. Supported target is Jetson "
+                "(Linux arm64).",
+            ),
             ok=False,
         )
 
-    checks: list[PackageCheck] = [
-        _check_exact_version("ultralytics", "ultralytics", ULTRALYTICS_VERSION),
-        _check_presence_and_import_with_validated_version(
-            "torch",
-            "torch",
-            "torch",
-            JETSON_TORCH_VERSION,
-        ),
-        _check_presence_and_import_with_validated_version(
-            "torchvision",
-            "torchvision",
-            "torchvision",
-            JETSON_TORCHVISION_VERSION,
-        ),
-        _check_presence_and_import_with_validated_version(
-            "onnxruntime",
-            "onnxruntime-gpu",
-            "onnxruntime",
-            JETSON_ONNXRUNTIME_GPU_VERSION,
-        ),
-        _check_jetson_tensorrt_distribution(),
-        _check_import_only("TensorRT Python import", "tensorrt"),
-    ]
+    _prefetch_distribution_versions(_PLATFORM_DISTRIBUTIONS[target])
+    checks = tuple(probe() for probe in probes)
 
     ok = all(check.status is PackageCheckStatus.OK for check in checks)
     return PlatformCheckReport(
@@ -100,47 +106,42 @@ def check_current_platform() -> PlatformCheckReport:
         platform_details=details,
         supported=True,
         checks=checks,
-        warnings=warnings,
         ok=ok,
     )
 
 
+@functools.cache
+def _platform_details() -> str:
+    """Describe the host once per process; ``platform.system()`` may shell out on Windows."""
+    return f"{py_platform.system()} {py_platform.machine()}"
+
+
+def _prefetch_distribution_versions(distributions: Sequence[str]) -> None:
+    """Warm the version cache concurrently; metadata reads are file I/O that releases the GIL.
+
+    The probes then run in order on the calling thread. Their imports execute module code
+    under the GIL, so running them on a pool would only add contention.
+    """
+    with ThreadPoolExecutor(max_workers=len(distributions)) as executor:
+        list(executor.map(_get_distribution_version, distributions))
+
+
 def render_platform_report(report: PlatformCheckReport) -> str:
     """Render a human-readable platform check report."""
+    jetson = report.platform_target is PlatformTarget.JETSON
+    hidden_import = _get_hidden_jetson_tensorrt_import_check(report) if jetson else None
     lines: list[str] = [
         f"Platform check: {report.platform_target.value} ({report.platform_details})",
         f"Status: {_status_label(report)}",
     ]
-    hidden_jetson_tensorrt_import = _get_hidden_jetson_tensorrt_import_check(report)
+    lines.extend(
+        _render_check_line(check, hidden_import)
+        for check in report.checks
+        if not (jetson and check.label == "TensorRT Python import")
+    )
+    lines.extend(f"warning: {warning}" for warning in report.warnings)
 
-    for check in report.checks:
-        if not _should_render_check(report, check):
-            continue
-        expected = (
-            f" expected={check.expected_version}" if check.expected_version is not None else ""
-        )
-        installed = (
-            f" installed={check.installed_version}" if check.installed_version is not None else ""
-        )
-        message = check.message
-        if (
-            check.label == "TensorRT package"
-            and hidden_jetson_tensorrt_import is not None
-            and hidden_jetson_tensorrt_import.status is not PackageCheckStatus.OK
-        ):
-            import_message = hidden_jetson_tensorrt_import.message or "import check failed"
-            if message:
-                message = f"{message}; {import_message}"
-            else:
-                message = import_message
-        suffix = f" - {message}" if message else ""
-        display_name = _render_check_display_name(check)
-        lines.append(f"[{check.status.name}] {display_name}{expected}{installed}{suffix}")
-
-    for warning in report.warnings:
-        lines.append(f"warning: {warning}")
-
-    if report.platform_target is PlatformTarget.JETSON and not report.ok:
+    if jetson and not report.ok:
         lines.append(
             "Jetson tip: prefer JetPack/system Python packages, then create the project venv with "
             "`uv venv --python /usr/bin/python3 --system-site-packages` and run `uv sync`."
@@ -149,6 +150,24 @@ def render_platform_report(report: PlatformCheckReport) -> str:
     return "\n".join(lines)
 
 
+def _render_check_line(check: PackageCheck, hidden_import: PackageCheck | None) -> str:
+    """Render one check, folding a hidden failed TensorRT import into the package line."""
+    message = check.message
+    if (
+        check.label == "TensorRT package"
+        and hidden_import is not None
+        and hidden_import.status is not PackageCheckStatus.OK
+    ):
+        import_message = hidden_import.message or "import check failed"
+        message = f"{message}; {import_message}" if message else import_message
+    expected = f" expected={check.expected_version}" if check.expected_version is not None else ""
+    installed = (
+        f" installed={check.installed_version}" if check.installed_version is not None else ""
+    )
+    suffix = f" - {message}" if message else ""
+    return f"[{check.status.name}] {_render_check_display_name(check)}{expected}{installed}{suffix}"
+
+
 def _render_check_display_name(check: PackageCheck) -> str:
     """Render a user-facing check name, including package alias details when helpful."""
     if (
@@ -161,21 +180,10 @@ def _render_check_display_name(check: PackageCheck) -> str:
     return check.label
 
 
-def _should_render_check(report: PlatformCheckReport, check: PackageCheck) -> bool:
-    return not (
-        report.platform_target is PlatformTarget.JETSON and check.label == "TensorRT Python import"
-    )
-
-
 def _get_hidden_jetson_tensorrt_import_check(
     report: PlatformCheckReport,
 ) -> PackageCheck | None:
-    if report.platform_target is not PlatformTarget.JETSON:
-        return None
-    for check in report.checks:
-        if check.label == "TensorRT Python import":
-            return check
-    return None
+    return next((check for check in report.checks if check.label == "TensorRT Python import"), None)
 
 
 def _status_label(report: PlatformCheckReport) -> str:
@@ -297,8 +305,7 @@ def _check_presence_and_import_with_validated_version(
 ) -> PackageCheck:
     """Require presence/import and display a baseline version without enforcing version match."""
     check = _check_presence_and_import(label, distribution, import_name)
-    check.expected_version = validated_version
-    return check
+    return check._replace(expected_version=validated_version)
 
 
 def _import_checked_module(import_name: str) -> None:
@@ -332,18 +339,66 @@ def _check_import_only(label: str, import_name: str) -> PackageCheck:
 def _versions_match(expected_version: str, installed_version: str) -> bool:
     if installed_version == expected_version:
         return True
+    expected = _parse_version(expected_version)
+    installed = _parse_version(installed_version)
+    return expected is not None and installed is not None and expected == installed
+
+
+@functools.cache
+def _parse_version(version: str) -> Version | None:
+    """Parse a PEP 440 version once; ``None`` if invalid or ``packaging`` is unavailable."""
     try:
         from packaging.version import InvalidVersion, Version
     except ImportError:
-        return False
+        return None
     try:
-        return Version(expected_version) == Version(installed_version)
+        return Version(version)
     except InvalidVersion:
-        return False
+        return None
 
 
+@functools.cache
 def _get_distribution_version(distribution: str) -> str | None:
+    from importlib import metadata as importlib_metadata
+
     try:
         return importlib_metadata.version(distribution)
     except importlib_metadata.PackageNotFoundError:
         return None
+
+
+# Probes are bound once per supported target; targets without an entry report as unsupported.
+_PLATFORM_PROBES: dict[PlatformTarget, tuple[Callable[[], PackageCheck], ...]] = {
+    PlatformTarget.JETSON: (
+        functools.partial(_check_exact_version, "ultralytics", "ultralytics", ULTRALYTICS_VERSION),
+        functools.partial(
+            _check_presence_and_import_with_validated_version,
+            "torch",
+            "torch",
+            "torch",
+            JETSON_TORCH_VERSION,
+        ),
+        functools.partial(
+            _check_presence_and_import_with_validated_version,
+            "torchvision",
+            "torchvision",
+            "torchvision",
+            JETSON_TORCHVISION_VERSION,
+        ),
+        functools.partial(
+            _check_presence_and_import_with_validated_version,
+            "onnxruntime",
+            "onnxruntime-gpu",
+            "onnxruntime",
+            JETSON_ONNXRUNTIME_GPU_VERSION,
+        ),
+        _check_jetson_tensorrt_distribution,
+        functools.partial(_check_import_only, "TensorRT Python import", "tensorrt"),
+    ),
+}
+
+
+# Distributions the probes above look up, read concurrently before the probes run.
+_PLATFORM_DISTRIBUTIONS: dict[PlatformTarget, tuple[str, ...]] = {
+    PlatformTarget.JETSON: ("ultralytics", "torch", "torchvision", "onnxruntime-gpu", "tensorrt"),
+}
@@ -2,14 +2,32 @@
 
 from __future__ import annotations
 
-import importlib
-import platform as py_platform
-from dataclasses import dataclass, field
+import functools
+import importlib.util
+import os
+import sys
+from dataclasses import dataclass, field, replace
 from enum import Enum
 
 from yolo_ex.errors import ExportValidationError
 from yolo_ex.models import ExportFormat
 
+NOCACHE_ENV_VAR = "YOLO_EX_NOCACHE"
+
+_ARM64_MACHINES = frozenset({"aarch64", "arm64"})
+_JETSON_RUNTIME_MODULES: tuple[str, ...] = ("torch", "torchvision", "onnxruntime")
+_TENSORRT_MODULE_MESSAGE = (
+    "TensorRT export requires the Jetson TensorRT Python package (`tensorrt`) and a "
+    "compatible JetPack/TensorRT runtime. If JetPack provides system Python packages, "
+    "create the project venv with `uv venv --python /usr/bin/python3 "
+    "--system-site-packages` before `uv sync`."
+)
+_JETSON_RUNTIME_MODULE_MESSAGE = (
+    "TensorRT export on Jetson requires `{module}`. If JetPack provides system Python "
+    "packages, create the project venv with `uv venv --python /usr/bin/python3 "
+    "--system-site-packages` before `uv sync`."
+)
+
 
 class PlatformTarget(str, Enum):
     """Supported runtime platform buckets."""
@@ -26,57 +44,83 @@ class PreflightResult:
     warnings: list[str] = field(default_factory=list)
 
 
+@dataclass(frozen=True, slots=True)
+class _PreflightSpec:
+    """Static preflight policy for one export format, resolved at import time."""
+
+    required_target: PlatformTarget
+    target_message: str
+    required_modules: tuple[tuple[str, str], ...]
+
+
+@functools.lru_cache(maxsize=1)
 def detect_platform() -> PlatformTarget:
-    """Detect the current platform bucket."""
-    system = py_platform.system().lower()
-    machine = py_platform.machine().lower()
-    if system == "linux" and machine in {"aarch64", "arm64"}:
+    """Detect the current platform bucket; the result is fixed for the process lifetime."""
+    system, machine = _read_platform()
+    if system.startswith("linux") and machine.lower() in _ARM64_MACHINES:
         return PlatformTarget.JETSON
     return PlatformTarget.OTHER
 
 
+def _read_platform() -> tuple[str, str]:
+    """Return ``(sys.platform, machine)``; the machine is only read on Linux, else ``""``."""
+    # sys.platform is a build-time constant, so only Linux hosts pay for a uname() call.
+    if not sys.platform.startswith("linux"):
+        return sys.platform, ""
+    return sys.platform, os.uname().machine
+
+
 def preflight_for_format(export_format: ExportFormat) -> PreflightResult:
-    """Validate platform/runtime requirements for the requested format."""
-    target = detect_platform()
-    if export_format is not ExportFormat.ENGINE:
+    """Validate platform/runtime requirements for the requested format.
+
+    Successful results are memoized per ``(format, platform)``; failures are re-checked.
+    Set ``YOLO_EX_NOCACHE`` or call :func:`clear_preflight_cache` to probe modules again.
+    """
+    if os.environ.get(NOCACHE_ENV_VAR):
+        return _cached_preflight.__wrapped__(export_format, detect_platform())
+    result = _cached_preflight(export_format, detect_platform())
+    return replace(result, warnings=list(result.warnings))
+
+
+def clear_preflight_cache() -> None:
+    """Forget memoized preflight results, e.g. after installing packages in-process."""
+    _cached_preflight.cache_clear()
+
+
+@functools.cache
+def _cached_preflight(export_format: ExportFormat, target: PlatformTarget) -> PreflightResult:
+    spec = _PREFLIGHT_SPECS.get(export_format)
+    if spec is None:
         raise ExportValidationError("Only --format engine is supported in this Jetson-only build.")
-    if target is not PlatformTarget.JETSON:
-        raise ExportValidationError(
+    if target is not spec.required_target:
+        raise ExportValidationError(spec.target_message)
+    for module_name, message in spec.required_modules:
+        _require_module(module_name, message)
+    return PreflightResult(target=target, warnings=[])
+
+
+_PREFLIGHT_SPECS: dict[ExportFormat, _PreflightSpec] = {
+    ExportFormat.ENGINE: _PreflightSpec(
+        required_target=PlatformTarget.JETSON,
+        target_message=(
             "TensorRT export is supported only on Jetson (Linux arm64). "
             "Run this command on a Jetson device with JetPack/TensorRT installed."
-        )
-
-    _require_module(
-        "tensorrt",
-        "TensorRT export requires the Jetson TensorRT Python package (`tensorrt`) and a "
-        "compatible JetPack/TensorRT runtime. If JetPack provides system Python packages, "
-        "create the project venv with `uv venv --python /usr/bin/python3 "
-        "--system-site-packages` before `uv sync`.",
-    )
-    _require_module(
-        "torch",
-        "TensorRT export on Jetson requires `torch`. If JetPack provides system Python "
-        "packages, create the project venv with `uv venv --python /usr/bin/python3 "
-        "--system-site-packages` before `uv sync`.",
-    )
-    _require_module(
-        "torchvision",
-        "TensorRT export on Jetson requires `torchvision`. If JetPack provides system "
-        "Python packages, create the project venv with `uv venv --python /usr/bin/python3 "
-        "--system-site-packages` before `uv sync`.",
-    )
-    _require_module(
-        "onnxruntime",
-        "TensorRT export on Jetson requires `onnxruntime`. If JetPack provides system "
-        "Python packages, create the project venv with `uv venv --python /usr/bin/python3 "
-        "--system-site-packages` before `uv sync`.",
-    )
-
-    return PreflightResult(target=target, warnings=[])
+        ),
+        # tensorrt goes first: it is the dependency most often missing from a fresh venv.
+        required_modules=(
+            ("tensorrt", _TENSORRT_MODULE_MESSAGE),
+            *(
+                (module_name, _JETSON_RUNTIME_MODULE_MESSAGE.format(module=module_name))
+                for module_name in _JETSON_RUNTIME_MODULES
+            ),
+        ),
+    ),
+}
 
 
 def _require_module(module_name: str, message: str) -> None:
-    try:
-        importlib.import_module(module_name)
-    except ImportError as exc:
-        raise ExportValidationError(message) from exc
+    """Require an importable module without executing it; a spec lookup is enough here."""
+    if sys.modules.get(module_name) is not None:
+        return
+    if importlib.util.find_spec(module_name) is None:
+        raise ExportValidationError(message)
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import pytest
+
+import yolo_ex.exporter as exporter
+import yolo_ex.platform_check as platform_check
+import yolo_ex.platforms as platforms
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches() -> Iterator[None]:
+    """Reset per-process caches so monkeypatched platform/import state is observed."""
+    caches = (
+        exporter._load_yolo_class,
+        exporter._ensure_tensorrt_module_compat,
+        platform_check._cached_platform_report,
+        platform_check._get_distribution_version,
+        platform_check._platform_details,
+        platforms._cached_preflight,
+        platforms.detect_platform,
+    )
+    for cached in caches:
+        cached.cache_clear()
+    yield
+    for cached in caches:
+        cached.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def pt_model_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Shared empty ``.pt`` file; validation only checks existence and suffix."""
+    path = tmp_path_factory.mktemp("pt") / "model.pt"
+    path.touch()
+    return path
+
+
+@pytest.fixture
+def fake_platform(monkeypatch: pytest.MonkeyPatch) -> Callable[[str, str], None]:
+    """Pretend to run on ``(sys.platform, uname machine)`` and drop the cached detection."""
+
+    def apply(sys_platform: str, machine: str) -> None:
+        monkeypatch.setattr(platforms, "_read_platform", lambda: (sys_platform, machine))
+        platforms.detect_platform.cache_clear()
+
+    return apply
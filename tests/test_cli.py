@@ -5,6 +5,7 @@ from pathlib import Path
 import pytest
 
 import yolo_ex.cli as cli
+import yolo_ex.exporter as exporter
 from yolo_ex.errors import ExportExecutionError
 from yolo_ex.models import ExportFormat, ExportResult
 from yolo_ex.platforms import PlatformTarget, PreflightResult
@@ -68,3 +69,23 @@ def test_cli_exporter_error_returns_1(
     captured = capsys.readouterr()
     assert exit_code == 1
     assert "boom" in captured.err
+
+
+def test_cli_validation_error_skips_yolo(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setattr(
+        cli,
+        "preflight_for_format",
+        lambda fmt: PreflightResult(target=PlatformTarget.JETSON),
+    )
+
+    def fail_load() -> None:
+        raise AssertionError("YOLO should not be loaded when validation fails")
+
+    monkeypatch.setattr(exporter, "_load_yolo_class", fail_load)
+
+    exit_code = cli.main(["export", str(tmp_path / "missing.pt"), "--format", "engine"])
+    captured = capsys.readouterr()
+    assert exit_code == 2
+    assert "not found" in captured.err
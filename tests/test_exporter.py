@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import json
+from collections.abc import Callable
+from importlib.machinery import ModuleSpec
 from pathlib import Path
 from types import ModuleType
 
@@ -11,12 +14,6 @@ from yolo_ex.exporter import build_export_kwargs, export_model, validate_request
 from yolo_ex.models import ExportFormat, ExportRequest
 
 
-def _pt_file(tmp_path: Path) -> Path:
-    path = tmp_path / "model.pt"
-    path.touch()
-    return path
-
-
 def test_validate_request_rejects_missing_file(tmp_path: Path) -> None:
     request = ExportRequest(model_path=tmp_path / "missing.pt", format=ExportFormat.ENGINE)
     with pytest.raises(ExportValidationError, match="not found"):
@@ -31,9 +28,9 @@ def test_validate_request_rejects_non_pt(tmp_path: Path) -> None:
         validate_request(request)
 
 
-def test_validate_request_accepts_workspace_for_engine(tmp_path: Path) -> None:
+def test_validate_request_accepts_workspace_for_engine(pt_model_file: Path) -> None:
     request = ExportRequest(
-        model_path=_pt_file(tmp_path),
+        model_path=pt_model_file,
         format=ExportFormat.ENGINE,
         workspace=4.0,
     )
@@ -41,9 +38,9 @@ def test_validate_request_accepts_workspace_for_engine(tmp_path: Path) -> None:
     validate_request(request)
 
 
-def test_build_export_kwargs_for_engine(tmp_path: Path) -> None:
+def test_build_export_kwargs_for_engine(pt_model_file: Path, tmp_path: Path) -> None:
     request = ExportRequest(
-        model_path=_pt_file(tmp_path),
+        model_path=pt_model_file,
         format=ExportFormat.ENGINE,
         output_dir=tmp_path / "exports",
         imgsz=320,
@@ -68,9 +65,9 @@ def test_build_export_kwargs_for_engine(tmp_path: Path) -> None:
     assert kwargs["name"] == "model"
 
 
-def test_build_export_kwargs_omits_optional_engine_fields_when_unset(tmp_path: Path) -> None:
+def test_build_export_kwargs_omits_optional_engine_fields_when_unset(pt_model_file: Path) -> None:
     request = ExportRequest(
-        model_path=_pt_file(tmp_path),
+        model_path=pt_model_file,
         format=ExportFormat.ENGINE,
     )
 
@@ -81,8 +78,10 @@ def test_build_export_kwargs_omits_optional_engine_fields_when_unset(tmp_path: P
     assert "workspace" not in kwargs
 
 
-def test_export_model_dry_run_skips_yolo(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
-    request = ExportRequest(model_path=_pt_file(tmp_path), format=ExportFormat.ENGINE, dry_run=True)
+def test_export_model_dry_run_skips_yolo(
+    monkeypatch: pytest.MonkeyPatch, pt_model_file: Path
+) -> None:
+    request = ExportRequest(model_path=pt_model_file, format=ExportFormat.ENGINE, dry_run=True)
 
     def fail_load() -> None:
         raise AssertionError("YOLO should not be loaded during dry run")
@@ -92,12 +91,13 @@ def test_export_model_dry_run_skips_yolo(monkeypatch: pytest.MonkeyPatch, tmp_pa
     result = export_model(request)
     assert result.output_path is None
     assert result.details["dry_run"] == "true"
+    assert json.loads(result.details["kwargs"])["imgsz"] == 640
 
 
 def test_export_model_dry_run_skips_tensorrt_compat(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch, pt_model_file: Path
 ) -> None:
-    request = ExportRequest(model_path=_pt_file(tmp_path), format=ExportFormat.ENGINE, dry_run=True)
+    request = ExportRequest(model_path=pt_model_file, format=ExportFormat.ENGINE, dry_run=True)
 
     def fail_compat() -> None:
         raise AssertionError("TensorRT compat shim should not run during dry run")
@@ -110,7 +110,7 @@ def test_export_model_dry_run_skips_tensorrt_compat(
 
 
 def test_export_model_wraps_backend_exception(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch, pt_model_file: Path
 ) -> None:
     class FakeYolo:
         def __init__(self, model_path: str) -> None:
@@ -121,12 +121,14 @@ def test_export_model_wraps_backend_exception(
 
     monkeypatch.setattr(exporter, "_load_yolo_class", lambda: FakeYolo)
 
-    request = ExportRequest(model_path=_pt_file(tmp_path), format=ExportFormat.ENGINE)
+    request = ExportRequest(model_path=pt_model_file, format=ExportFormat.ENGINE)
     with pytest.raises(ExportExecutionError, match="Ultralytics export failed"):
         export_model(request)
 
 
-def test_export_model_returns_path(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+def test_export_model_returns_path(
+    monkeypatch: pytest.MonkeyPatch, pt_model_file: Path, tmp_path: Path
+) -> None:
     output = tmp_path / "model.engine"
 
     class FakeYolo:
@@ -138,13 +140,14 @@ def test_export_model_returns_path(monkeypatch: pytest.MonkeyPatch, tmp_path: Pa
 
     monkeypatch.setattr(exporter, "_load_yolo_class", lambda: FakeYolo)
 
-    request = ExportRequest(model_path=_pt_file(tmp_path), format=ExportFormat.ENGINE)
+    request = ExportRequest(model_path=pt_model_file, format=ExportFormat.ENGINE)
     result = export_model(request)
     assert result.output_path == output
+    assert result.details == {"dry_run": "false"}
 
 
 def test_export_model_engine_calls_tensorrt_compat(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch, pt_model_file: Path, tmp_path: Path
 ) -> None:
     called = False
 
@@ -162,46 +165,68 @@ def test_export_model_engine_calls_tensorrt_compat(
     monkeypatch.setattr(exporter, "_ensure_tensorrt_module_compat", fake_compat)
     monkeypatch.setattr(exporter, "_load_yolo_class", lambda: FakeYolo)
 
-    request = ExportRequest(model_path=_pt_file(tmp_path), format=ExportFormat.ENGINE)
+    request = ExportRequest(model_path=pt_model_file, format=ExportFormat.ENGINE)
     export_model(request)
 
     assert called is True
 
 
+def _fake_find_spec(available: set[str]) -> Callable[[str], ModuleSpec | None]:
+    def fake_find_spec(name: str) -> ModuleSpec | None:
+        return ModuleSpec(name, None) if name in available else None
+
+    return fake_find_spec
+
+
 def test_ensure_tensorrt_module_compat_aliases_tensorrt_bindings(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     fake_module = ModuleType("tensorrt_bindings")
 
     def fake_import(name: str) -> object:
-        if name == "tensorrt":
-            raise ModuleNotFoundError(name)
         if name == "tensorrt_bindings":
             return fake_module
         raise AssertionError(f"unexpected import {name}")
 
     monkeypatch.delitem(exporter.sys.modules, "tensorrt", raising=False)
+    monkeypatch.setattr(
+        exporter.importlib.util, "find_spec", _fake_find_spec({"tensorrt_bindings"})
+    )
     monkeypatch.setattr(exporter.importlib, "import_module", fake_import)
 
     exporter._ensure_tensorrt_module_compat()
 
-    assert exporter.sys.modules["tensorrt"] is fake_module
+    assert exporter.sys.modules.pop("tensorrt") is fake_module
 
 
 def test_ensure_tensorrt_module_compat_noop_when_tensorrt_exists(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    fake_module = ModuleType("tensorrt")
+    def fail_import(name: str) -> object:
+        raise AssertionError(f"unexpected import {name}")
+
+    monkeypatch.delitem(exporter.sys.modules, "tensorrt", raising=False)
+    monkeypatch.setattr(exporter.importlib.util, "find_spec", _fake_find_spec({"tensorrt"}))
+    monkeypatch.setattr(exporter.importlib, "import_module", fail_import)
+
+    exporter._ensure_tensorrt_module_compat()
+
+    assert "tensorrt" not in exporter.sys.modules
+
+
+def test_ensure_tensorrt_module_compat_runs_once_per_process(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     calls: list[str] = []
 
-    def fake_import(name: str) -> object:
+    def fake_find_spec(name: str) -> ModuleSpec:
         calls.append(name)
-        if name == "tensorrt":
-            return fake_module
-        raise AssertionError(f"unexpected import {name}")
+        return ModuleSpec(name, None)
 
-    monkeypatch.setattr(exporter.importlib, "import_module", fake_import)
+    monkeypatch.delitem(exporter.sys.modules, "tensorrt", raising=False)
+    monkeypatch.setattr(exporter.importlib.util, "find_spec", fake_find_spec)
 
+    exporter._ensure_tensorrt_module_compat()
     exporter._ensure_tensorrt_module_compat()
 
     assert calls == ["tensorrt"]
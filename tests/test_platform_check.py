@@ -1,11 +1,23 @@
 from __future__ import annotations
 
+import contextlib
+import importlib
+import sys
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from importlib import metadata as importlib_metadata
+from pathlib import Path
+from types import SimpleNamespace
+
 import pytest
 
 import yolo_ex.platform_check as platform_check
+import yolo_ex.platforms as platforms
 from yolo_ex.platform_check import (
     PackageCheckStatus,
     check_current_platform,
+    clear_platform_check_cache,
     render_platform_report,
 )
 from yolo_ex.platforms import PlatformTarget
@@ -23,159 +35,70 @@ def _patch_platform(
     monkeypatch.setattr(platform_check.py_platform, "machine", lambda: machine)
 
 
-def test_check_current_platform_jetson_happy_path(monkeypatch: pytest.MonkeyPatch) -> None:
-    _patch_platform(
-        monkeypatch,
-        target=PlatformTarget.JETSON,
-        system="Linux",
-        machine="aarch64",
-    )
-
-    versions = {
-        "ultralytics": "8.4.14",
-        "torch": "2.5.0a0+872d972e41.nv24.08",
-        "torchvision": "0.20.0a0+afc54f7",
-        "onnxruntime-gpu": "1.23.0",
-        "tensorrt": "10.7.0",
-    }
-    monkeypatch.setattr(platform_check.importlib_metadata, "version", lambda name: versions[name])
-    monkeypatch.setattr(platform_check.importlib, "import_module", lambda name: object())
-
-    report = check_current_platform()
-
-    assert report.supported is True
-    assert report.ok is True
-    assert report.platform_target is PlatformTarget.JETSON
-    assert all(check.status is PackageCheckStatus.OK for check in report.checks)
-    rendered = render_platform_report(report)
-    assert "Platform check: jetson" in rendered
-
-
-def test_check_current_platform_jetson_tensorrt_import_failure(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    _patch_platform(
-        monkeypatch,
-        target=PlatformTarget.JETSON,
-        system="Linux",
-        machine="aarch64",
-    )
+BASE_JETSON_VERSIONS: dict[str, str] = {
+    "ultralytics": "8.4.14",
+    "torch": "2.5.0a0+872d972e41.nv24.08",
+    "torchvision": "0.20.0a0+afc54f7",
+    "onnxruntime-gpu": "1.23.0",
+    "tensorrt": "10.7.0",
+}
 
-    versions = {
-        "ultralytics": "8.4.14",
-        "torch": "2.5.0a0+872d972e41.nv24.08",
-        "torchvision": "0.20.0a0+afc54f7",
-        "onnxruntime-gpu": "1.23.0",
-        "tensorrt": "10.7.0",
-    }
 
+def _fake_version(versions: dict[str, str]) -> Callable[[str], str]:
     def fake_version(name: str) -> str:
-        if name not in versions:
-            raise platform_check.importlib_metadata.PackageNotFoundError(name)
-        return versions[name]
+        try:
+            return versions[name]
+        except KeyError:
+            raise importlib_metadata.PackageNotFoundError(name) from None
 
-    monkeypatch.setattr(platform_check.importlib_metadata, "version", fake_version)
+    return fake_version
 
-    def fake_import(name: str) -> object:
-        if name == "tensorrt":
-            raise ImportError("libnvinfer.so missing")
-        return object()
 
-    monkeypatch.setattr(platform_check.importlib, "import_module", fake_import)
+@dataclass(frozen=True)
+class JetsonCase:
+    """One Jetson check scenario: environment tweaks plus the expected check outcome."""
 
-    report = check_current_platform()
+    label: str
+    status: PackageCheckStatus
+    ok: bool
+    overrides: dict[str, str | None] = field(default_factory=dict)
+    import_failures: dict[str, str] = field(default_factory=dict)
+    fields: dict[str, object] = field(default_factory=dict)
+    message_contains: str | None = None
+    rendered: tuple[str, ...] = ()
+    not_rendered: tuple[str, ...] = ()
 
-    assert report.supported is True
-    assert report.ok is False
-    tensorrt_import = next(
-        check for check in report.checks if check.label == "TensorRT Python import"
-    )
-    assert tensorrt_import.status is PackageCheckStatus.MISSING
-    assert "import failed" in tensorrt_import.message
-    rendered = render_platform_report(report)
-    assert "TensorRT Python import" not in rendered
-    assert "[OK] TensorRT package" in rendered
-    assert "libnvinfer.so missing" in rendered
-    assert "Jetson tip:" in rendered
-    assert "--system-site-packages" in rendered
 
+@dataclass
+class PlatformEnv:
+    """Mutable fake package environment read by the patched metadata lookup and importer."""
 
-def test_check_current_platform_jetson_torch_version_normalization(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    _patch_platform(
-        monkeypatch,
-        target=PlatformTarget.JETSON,
-        system="Linux",
-        machine="aarch64",
-    )
-    versions = {
-        "ultralytics": "8.4.14",
-        "torch": "2.5.0a0+872d972e41.nv24.8",
-        "torchvision": "0.20.0a0+afc54f7",
-        "onnxruntime-gpu": "1.23.0",
-        "tensorrt": "10.7.0",
-    }
+    versions: dict[str, str] = field(default_factory=lambda: dict(BASE_JETSON_VERSIONS))
+    import_failures: dict[str, str] = field(default_factory=dict)
+    lookups: list[str] = field(default_factory=list)
 
-    def fake_version(name: str) -> str:
-        if name not in versions:
-            raise platform_check.importlib_metadata.PackageNotFoundError(name)
-        return versions[name]
-
-    monkeypatch.setattr(platform_check.importlib_metadata, "version", fake_version)
-    monkeypatch.setattr(platform_check.importlib, "import_module", lambda name: object())
-
-    report = check_current_platform()
 
-    torch_check = next(check for check in report.checks if check.label == "torch")
-    assert torch_check.status is PackageCheckStatus.OK
-
-
-def test_check_current_platform_jetson_does_not_accept_tensorrt_bindings_fallback(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    _patch_platform(
-        monkeypatch,
-        target=PlatformTarget.JETSON,
-        system="Linux",
-        machine="aarch64",
-    )
-    versions = {
-        "ultralytics": "8.4.14",
-        "torch": "2.5.0a0+872d972e41.nv24.8",
-        "torchvision": "0.20.0a0+afc54f7",
-        "onnxruntime-gpu": "1.23.0",
-        "tensorrt": "10.7.0",
-    }
+@pytest.fixture
+def platform_env(monkeypatch: pytest.MonkeyPatch) -> PlatformEnv:
+    env = PlatformEnv()
+    lookup_version = _fake_version(env.versions)
 
     def fake_version(name: str) -> str:
-        if name not in versions:
-            raise platform_check.importlib_metadata.PackageNotFoundError(name)
-        return versions[name]
+        env.lookups.append(name)
+        return lookup_version(name)
 
     def fake_import(name: str) -> object:
-        if name == "tensorrt":
-            raise ImportError("No module named 'tensorrt'")
-        if name == "tensorrt_bindings":
-            return object()
+        if name in env.import_failures:
+            raise ImportError(env.import_failures[name])
         return object()
 
-    monkeypatch.setattr(platform_check.importlib_metadata, "version", fake_version)
+    monkeypatch.setattr(importlib_metadata, "version", fake_version)
     monkeypatch.setattr(platform_check.importlib, "import_module", fake_import)
+    return env
 
-    report = check_current_platform()
-
-    assert report.ok is False
-    tensorrt_import = next(
-        check for check in report.checks if check.label == "TensorRT Python import"
-    )
-    assert tensorrt_import.status is PackageCheckStatus.MISSING
-    assert tensorrt_import.import_name == "tensorrt"
-    assert "import failed" in tensorrt_import.message
 
-
-def test_check_current_platform_jetson_tensorrt_metapackage_is_accepted(
-    monkeypatch: pytest.MonkeyPatch,
+def test_check_current_platform_jetson_happy_path(
+    monkeypatch: pytest.MonkeyPatch, platform_env: PlatformEnv
 ) -> None:
     _patch_platform(
         monkeypatch,
@@ -184,68 +107,157 @@ def test_check_current_platform_jetson_tensorrt_metapackage_is_accepted(
         machine="aarch64",
     )
 
-    versions = {
-        "ultralytics": "8.4.14",
-        "torch": "2.5.0a0+872d972e41.nv24.08",
-        "torchvision": "0.20.0a0+afc54f7",
-        "onnxruntime-gpu": "1.23.0",
-        "tensorrt": "10.7.0",
-    }
-
-    def fake_version(name: str) -> str:
-        if name not in versions:
-            raise platform_check.importlib_metadata.PackageNotFoundError(name)
-        return versions[name]
-
-    monkeypatch.setattr(platform_check.importlib_metadata, "version", fake_version)
-    monkeypatch.setattr(platform_check.importlib, "import_module", lambda name: object())
-
     report = check_current_platform()
 
+    assert report.supported is True
     assert report.ok is True
-    tensorrt_package = next(check for check in report.checks if check.label == "TensorRT package")
-    assert tensorrt_package.status is PackageCheckStatus.OK
-    assert tensorrt_package.distribution == "tensorrt"
+    assert report.platform_target is PlatformTarget.JETSON
+    assert all(check.status is PackageCheckStatus.OK for check in report.checks)
+    assert [check.label for check in report.checks] == [
+        "ultralytics",
+        "torch",
+        "torchvision",
+        "onnxruntime",
+        "TensorRT package",
+        "TensorRT Python import",
+    ]
     rendered = render_platform_report(report)
-    assert "[OK] TensorRT package expected=10.7.0 installed=10.7.0" in rendered
-    assert "TensorRT Python import" not in rendered
-
-
-def test_check_current_platform_jetson_requires_tensorrt_package_metadata(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    _patch_platform(
-        monkeypatch,
-        target=PlatformTarget.JETSON,
-        system="Linux",
-        machine="aarch64",
-    )
-
-    versions = {
-        "ultralytics": "8.4.14",
-        "torch": "2.5.0a0+872d972e41.nv24.08",
-        "torchvision": "0.20.0a0+afc54f7",
-        "onnxruntime-gpu": "1.23.0",
-    }
-
-    def fake_version(name: str) -> str:
-        if name not in versions:
-            raise platform_check.importlib_metadata.PackageNotFoundError(name)
-        return versions[name]
-
-    monkeypatch.setattr(platform_check.importlib_metadata, "version", fake_version)
-    monkeypatch.setattr(platform_check.importlib, "import_module", lambda name: object())
-
-    report = check_current_platform()
-
-    assert report.ok is False
-    tensorrt_package = next(check for check in report.checks if check.label == "TensorRT package")
-    assert tensorrt_package.status is PackageCheckStatus.MISSING
-    assert tensorrt_package.distribution == "tensorrt"
+    assert "Platform check: jetson" in rendered
 
 
-def test_check_current_platform_jetson_accepts_system_package_torch_versions(
+@pytest.mark.parametrize(
+    "case",
+    [
+        pytest.param(
+            JetsonCase(
+                label="TensorRT Python import",
+                status=PackageCheckStatus.MISSING,
+                ok=False,
+                import_failures={"tensorrt": "libnvinfer.so missing"},
+                message_contains="import failed",
+                rendered=(
+                    "[OK] TensorRT package",
+                    "libnvinfer.so missing",
+                    "Jetson tip:",
+                    "--system-site-packages",
+                ),
+                not_rendered=("TensorRT Python import",),
+            ),
+            id="tensorrt-import-failure",
+        ),
+        pytest.param(
+            JetsonCase(
+                label="torch",
+                status=PackageCheckStatus.OK,
+                ok=True,
+                overrides={"torch": "2.5.0a0+872d972e41.nv24.8"},
+            ),
+            id="torch-version-normalization",
+        ),
+        pytest.param(
+            JetsonCase(
+                label="TensorRT Python import",
+                status=PackageCheckStatus.MISSING,
+                ok=False,
+                overrides={"torch": "2.5.0a0+872d972e41.nv24.8"},
+                import_failures={"tensorrt": "No module named 'tensorrt'"},
+                fields={"import_name": "tensorrt"},
+                message_contains="import failed",
+            ),
+            id="tensorrt-bindings-fallback-rejected",
+        ),
+        pytest.param(
+            JetsonCase(
+                label="TensorRT package",
+                status=PackageCheckStatus.OK,
+                ok=True,
+                fields={"distribution": "tensorrt"},
+                rendered=("[OK] TensorRT package expected=10.7.0 installed=10.7.0",),
+                not_rendered=("TensorRT Python import",),
+            ),
+            id="tensorrt-metapackage-accepted",
+        ),
+        pytest.param(
+            JetsonCase(
+                label="TensorRT package",
+                status=PackageCheckStatus.MISSING,
+                ok=False,
+                overrides={"tensorrt": None},
+                fields={"distribution": "tensorrt"},
+            ),
+            id="tensorrt-metadata-required",
+        ),
+        pytest.param(
+            JetsonCase(
+                label="torch",
+                status=PackageCheckStatus.OK,
+                ok=True,
+                overrides={"torch": "2.6.0", "torchvision": "0.21.0", "onnxruntime-gpu": "1.99.0"},
+                fields={
+                    "message": "",
+                    "expected_version": "2.5.0a0+872d972e41.nv24.08",
+                    "installed_version": "2.6.0",
+                },
+            ),
+            id="system-package-torch-versions",
+        ),
+        pytest.param(
+            JetsonCase(
+                label="onnxruntime",
+                status=PackageCheckStatus.OK,
+                ok=True,
+                fields={
+                    "distribution": "onnxruntime-gpu",
+                    "import_name": "onnxruntime",
+                    "expected_version": "1.23.0",
+                    "installed_version": "1.23.0",
+                },
+                rendered=(
+                    "[OK] onnxruntime (dist: onnxruntime-gpu) expected=1.23.0 installed=1.23.0",
+                ),
+            ),
+            id="onnxruntime-happy-path",
+        ),
+        pytest.param(
+            JetsonCase(
+                label="onnxruntime",
+                status=PackageCheckStatus.MISSING,
+                ok=False,
+                overrides={"onnxruntime-gpu": None},
+                fields={"distribution": "onnxruntime-gpu"},
+                rendered=(
+                    "[MISSING] onnxruntime (dist: onnxruntime-gpu) expected=1.23.0"
+                    " - distribution not installed",
+                ),
+            ),
+            id="onnxruntime-gpu-missing",
+        ),
+        pytest.param(
+            JetsonCase(
+                label="onnxruntime",
+                status=PackageCheckStatus.MISSING,
+                ok=False,
+                import_failures={"onnxruntime": "onnxruntime import failed"},
+                message_contains="import failed",
+            ),
+            id="onnxruntime-import-failure",
+        ),
+        pytest.param(
+            JetsonCase(
+                label="onnxruntime",
+                status=PackageCheckStatus.OK,
+                ok=True,
+                overrides={"onnxruntime-gpu": "1.24.0"},
+                fields={"expected_version": "1.23.0", "installed_version": "1.24.0", "message": ""},
+            ),
+            id="onnxruntime-version-mismatch-allowed",
+        ),
+    ],
+)
+def test_check_current_platform_jetson_cases(
     monkeypatch: pytest.MonkeyPatch,
+    platform_env: PlatformEnv,
+    case: JetsonCase,
 ) -> None:
     _patch_platform(
         monkeypatch,
@@ -253,30 +265,28 @@ def test_check_current_platform_jetson_accepts_system_package_torch_versions(
         system="Linux",
         machine="aarch64",
     )
-    versions = {
-        "ultralytics": "8.4.14",
-        "torch": "2.6.0",
-        "torchvision": "0.21.0",
-        "onnxruntime-gpu": "1.99.0",
-        "tensorrt": "10.7.0",
-    }
-
-    def fake_version(name: str) -> str:
-        if name not in versions:
-            raise platform_check.importlib_metadata.PackageNotFoundError(name)
-        return versions[name]
-
-    monkeypatch.setattr(platform_check.importlib_metadata, "version", fake_version)
-    monkeypatch.setattr(platform_check.importlib, "import_module", lambda name: object())
+    for name, version in case.overrides.items():
+        if version is None:
+            del platform_env.versions[name]
+        else:
+            platform_env.versions[name] = version
+    platform_env.import_failures.update(case.import_failures)
 
     report = check_current_platform()
 
-    assert report.ok is True
-    torch_check = next(check for check in report.checks if check.label == "torch")
-    assert torch_check.status is PackageCheckStatus.OK
-    assert torch_check.message == ""
-    assert torch_check.expected_version == "2.5.0a0+872d972e41.nv24.08"
-    assert torch_check.installed_version == "2.6.0"
+    assert report.supported is True
+    assert report.ok is case.ok
+    check = next(check for check in report.checks if check.label == case.label)
+    assert check.status is case.status
+    for name, value in case.fields.items():
+        assert getattr(check, name) == value
+    if case.message_contains is not None:
+        assert case.message_contains in check.message
+    rendered = render_platform_report(report)
+    for fragment in case.rendered:
+        assert fragment in rendered
+    for fragment in case.not_rendered:
+        assert fragment not in rendered
 
 
 def test_check_current_platform_unsupported(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -291,43 +301,38 @@ def test_check_current_platform_unsupported(monkeypatch: pytest.MonkeyPatch) ->
 
     assert report.supported is False
     assert report.ok is False
-    assert report.checks == []
+    assert report.platform_details == "Linux x86_64"
+    assert report.checks == ()
     assert report.warnings
 
 
-def test_check_current_platform_jetson_onnxruntime_happy_path(
+def test_check_current_platform_unsupported_skips_package_probes(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     _patch_platform(
         monkeypatch,
-        target=PlatformTarget.JETSON,
-        system="Linux",
-        machine="aarch64",
+        target=PlatformTarget.OTHER,
+        system="Darwin",
+        machine="arm64",
     )
-    versions = {
-        "ultralytics": "8.4.14",
-        "torch": "2.5.0a0+872d972e41.nv24.08",
-        "torchvision": "0.20.0a0+afc54f7",
-        "onnxruntime-gpu": "1.23.0",
-        "tensorrt": "10.7.0",
-    }
-    monkeypatch.setattr(platform_check.importlib_metadata, "version", lambda name: versions[name])
-    monkeypatch.setattr(platform_check.importlib, "import_module", lambda name: object())
+
+    def fail_version(name: str) -> str:
+        raise AssertionError(f"unexpected metadata lookup {name}")
+
+    def fail_import(name: str) -> object:
+        raise AssertionError(f"unexpected import {name}")
+
+    monkeypatch.setattr(importlib_metadata, "version", fail_version)
+    monkeypatch.setattr(platform_check.importlib, "import_module", fail_import)
 
     report = check_current_platform()
 
-    onnxruntime_check = next(check for check in report.checks if check.label == "onnxruntime")
-    assert onnxruntime_check.status is PackageCheckStatus.OK
-    assert onnxruntime_check.distribution == "onnxruntime-gpu"
-    assert onnxruntime_check.import_name == "onnxruntime"
-    assert onnxruntime_check.expected_version == "1.23.0"
-    assert onnxruntime_check.installed_version == "1.23.0"
-    rendered = render_platform_report(report)
-    assert "[OK] onnxruntime (dist: onnxruntime-gpu) expected=1.23.0 installed=1.23.0" in rendered
+    assert report.supported is False
+    assert report.checks == ()
 
 
-def test_check_current_platform_jetson_missing_onnxruntime_gpu_renders_distribution_alias(
-    monkeypatch: pytest.MonkeyPatch,
+def test_check_current_platform_cache_can_be_bypassed_or_cleared(
+    monkeypatch: pytest.MonkeyPatch, platform_env: PlatformEnv
 ) -> None:
     _patch_platform(
         monkeypatch,
@@ -335,37 +340,28 @@ def test_check_current_platform_jetson_missing_onnxruntime_gpu_renders_distribut
         system="Linux",
         machine="aarch64",
     )
+    monkeypatch.delenv(platforms.NOCACHE_ENV_VAR, raising=False)
 
-    versions = {
-        "ultralytics": "8.4.14",
-        "torch": "2.5.0a0+872d972e41.nv24.08",
-        "torchvision": "0.20.0a0+afc54f7",
-        "tensorrt": "10.7.0",
-    }
+    first = check_current_platform()
+    platform_env.versions["ultralytics"] = "8.4.15"
 
-    def fake_version(name: str) -> str:
-        if name not in versions:
-            raise platform_check.importlib_metadata.PackageNotFoundError(name)
-        return versions[name]
+    cached = check_current_platform()
+    assert cached is first
+    assert cached.ok is True
 
-    monkeypatch.setattr(platform_check.importlib_metadata, "version", fake_version)
-    monkeypatch.setattr(platform_check.importlib, "import_module", lambda name: object())
+    monkeypatch.setenv(platforms.NOCACHE_ENV_VAR, "1")
+    assert check_current_platform().ok is False
 
-    report = check_current_platform()
+    platform_env.versions["ultralytics"] = "8.4.14"
+    monkeypatch.delenv(platforms.NOCACHE_ENV_VAR)
+    assert check_current_platform() is first
+    platform_env.versions["ultralytics"] = "8.4.15"
+    clear_platform_check_cache()
+    assert check_current_platform().ok is False
 
-    assert report.ok is False
-    onnxruntime_check = next(check for check in report.checks if check.label == "onnxruntime")
-    assert onnxruntime_check.status is PackageCheckStatus.MISSING
-    assert onnxruntime_check.distribution == "onnxruntime-gpu"
-    rendered = render_platform_report(report)
-    assert (
-        "[MISSING] onnxruntime (dist: onnxruntime-gpu) expected=1.23.0 - distribution not installed"
-        in rendered
-    )
 
-
-def test_check_current_platform_jetson_onnxruntime_import_failure(
-    monkeypatch: pytest.MonkeyPatch,
+def test_check_current_platform_looks_up_each_distribution_once(
+    monkeypatch: pytest.MonkeyPatch, platform_env: PlatformEnv
 ) -> None:
     _patch_platform(
         monkeypatch,
@@ -373,32 +369,14 @@ def test_check_current_platform_jetson_onnxruntime_import_failure(
         system="Linux",
         machine="aarch64",
     )
-    versions = {
-        "ultralytics": "8.4.14",
-        "torch": "2.5.0a0+872d972e41.nv24.08",
-        "torchvision": "0.20.0a0+afc54f7",
-        "onnxruntime-gpu": "1.23.0",
-        "tensorrt": "10.7.0",
-    }
 
-    def fake_import(name: str) -> object:
-        if name == "onnxruntime":
-            raise ImportError("onnxruntime import failed")
-        return object()
+    check_current_platform()
 
-    monkeypatch.setattr(platform_check.importlib_metadata, "version", lambda name: versions[name])
-    monkeypatch.setattr(platform_check.importlib, "import_module", fake_import)
+    assert sorted(platform_env.lookups) == sorted(BASE_JETSON_VERSIONS)
 
-    report = check_current_platform()
 
-    assert report.ok is False
-    onnxruntime_check = next(check for check in report.checks if check.label == "onnxruntime")
-    assert onnxruntime_check.status is PackageCheckStatus.MISSING
-    assert "import failed" in onnxruntime_check.message
-
-
-def test_check_current_platform_jetson_onnxruntime_version_mismatch_is_allowed(
-    monkeypatch: pytest.MonkeyPatch,
+def test_check_current_platform_imports_serially_after_version_lookups(
+    monkeypatch: pytest.MonkeyPatch, platform_env: PlatformEnv
 ) -> None:
     _patch_platform(
         monkeypatch,
@@ -406,21 +384,53 @@ def test_check_current_platform_jetson_onnxruntime_version_mismatch_is_allowed(
         system="Linux",
         machine="aarch64",
     )
-    versions = {
-        "ultralytics": "8.4.14",
-        "torch": "2.5.0a0+872d972e41.nv24.08",
-        "torchvision": "0.20.0a0+afc54f7",
-        "onnxruntime-gpu": "1.24.0",
-        "tensorrt": "10.7.0",
-    }
-    monkeypatch.setattr(platform_check.importlib_metadata, "version", lambda name: versions[name])
-    monkeypatch.setattr(platform_check.importlib, "import_module", lambda name: object())
+    imports: list[str] = []
+
+    def recording_import(name: str) -> object:
+        assert threading.current_thread() is threading.main_thread()
+        assert sorted(platform_env.lookups) == sorted(BASE_JETSON_VERSIONS)
+        imports.append(name)
+        return object()
+
+    monkeypatch.setattr(platform_check.importlib, "import_module", recording_import)
 
     report = check_current_platform()
 
     assert report.ok is True
-    onnxruntime_check = next(check for check in report.checks if check.label == "onnxruntime")
-    assert onnxruntime_check.status is PackageCheckStatus.OK
-    assert onnxruntime_check.expected_version == "1.23.0"
-    assert onnxruntime_check.installed_version == "1.24.0"
-    assert onnxruntime_check.message == ""
+    assert imports == ["torch", "torchvision", "onnxruntime", "tensorrt"]
+
+
+def test_presence_check_waits_for_in_progress_import(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    # A module another thread is still importing is already in sys.modules; the check must
+    # wait for that import to finish instead of reporting the half-initialized module as OK.
+    gate = SimpleNamespace(started=threading.Event(), release=threading.Event())
+    monkeypatch.setitem(sys.modules, "yolo_ex_fake_gate", gate)
+    (tmp_path / "yolo_ex_fake_broken.py").write_text(
+        "import yolo_ex_fake_gate as gate\n"
+        "gate.started.set()\n"
+        "gate.release.wait(5)\n"
+        "raise ImportError('broken native extension')\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(importlib_metadata, "version", lambda name: "1.0")
+
+    def import_in_background() -> None:
+        with contextlib.suppress(ImportError):
+            importlib.import_module("yolo_ex_fake_broken")
+
+    importer = threading.Thread(target=import_in_background)
+    importer.start()
+    assert gate.started.wait(5)
+    releaser = threading.Timer(0.05, gate.release.set)
+    releaser.start()
+
+    check = platform_check._check_presence_and_import(
+        "broken", "yolo-ex-fake-broken", "yolo_ex_fake_broken"
+    )
+
+    importer.join()
+    releaser.join()
+    assert check.status is PackageCheckStatus.MISSING
+    assert "broken native extension" in check.message
@@ -10,8 +10,8 @@ def _report(*, target: PlatformTarget, supported: bool, ok: bool) -> PlatformChe
         platform_target=target,
         platform_details="TestOS testarch",
         supported=supported,
-        checks=[],
-        warnings=[],
+        checks=(),
+        warnings=(),
         ok=ok,
     )
 
@@ -1,95 +1,215 @@
 from __future__ import annotations
 
-from types import SimpleNamespace
+import re
+from collections.abc import Callable
+from importlib.machinery import ModuleSpec
+from types import ModuleType, SimpleNamespace
 
 import pytest
 
 import yolo_ex.platforms as platforms
 from yolo_ex.errors import ExportValidationError
 from yolo_ex.models import ExportFormat
-from yolo_ex.platforms import PlatformTarget, detect_platform, preflight_for_format
-
-
-def test_detect_platform_jetson(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr(platforms.py_platform, "system", lambda: "Linux")
-    monkeypatch.setattr(platforms.py_platform, "machine", lambda: "aarch64")
-    assert detect_platform() is PlatformTarget.JETSON
-
-
-def test_detect_platform_other(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr(platforms.py_platform, "system", lambda: "Linux")
-    monkeypatch.setattr(platforms.py_platform, "machine", lambda: "x86_64")
-    assert detect_platform() is PlatformTarget.OTHER
+from yolo_ex.platforms import (
+    PlatformTarget,
+    clear_preflight_cache,
+    detect_platform,
+    preflight_for_format,
+)
+
+_NON_JETSON_MSG = re.compile(r"supported only on Jetson")
+_SYSTEM_SITE_PACKAGES_MSG = re.compile(r"--system-site-packages")
+_TENSORRT_MSG = re.compile(r"\(`tensorrt`\)")
+_RUNTIME_MODULE_MSGS = {
+    module: re.compile(rf"requires `{module}`")
+    for module in ("torch", "torchvision", "onnxruntime")
+}
+# Preflight only checks that a spec exists, so every "installed" module can share one.
+_FAKE_SPEC = ModuleSpec("fake", None)
+
+
+@pytest.mark.parametrize(
+    ("sys_platform", "machine", "expected"),
+    [
+        pytest.param("linux", "aarch64", PlatformTarget.JETSON, id="linux-aarch64"),
+        pytest.param("linux", "ARM64", PlatformTarget.JETSON, id="linux-arm64-upper"),
+        pytest.param("linux", "x86_64", PlatformTarget.OTHER, id="linux-x86_64"),
+        pytest.param("darwin", "arm64", PlatformTarget.OTHER, id="macos-arm64"),
+        pytest.param("win32", "ARM64", PlatformTarget.OTHER, id="windows-arm64"),
+    ],
+)
+def test_detect_platform(
+    fake_platform: Callable[[str, str], None],
+    sys_platform: str,
+    machine: str,
+    expected: PlatformTarget,
+) -> None:
+    fake_platform(sys_platform, machine)
+    assert detect_platform() is expected
 
 
 def test_engine_preflight_rejects_non_jetson(
-    monkeypatch: pytest.MonkeyPatch,
+    fake_platform: Callable[[str, str], None],
 ) -> None:
-    monkeypatch.setattr(platforms.py_platform, "system", lambda: "Linux")
-    monkeypatch.setattr(platforms.py_platform, "machine", lambda: "x86_64")
+    fake_platform("linux", "x86_64")
 
-    with pytest.raises(ExportValidationError, match="supported only on Jetson"):
+    with pytest.raises(ExportValidationError, match=_NON_JETSON_MSG):
         preflight_for_format(ExportFormat.ENGINE)
 
 
-def test_engine_preflight_missing_dependency_message(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr(platforms.py_platform, "system", lambda: "Linux")
-    monkeypatch.setattr(platforms.py_platform, "machine", lambda: "aarch64")
-
-    def fake_import(name: str) -> SimpleNamespace:
-        raise ModuleNotFoundError(name)
+def test_engine_preflight_missing_dependency_message(
+    monkeypatch: pytest.MonkeyPatch,
+    fake_platform: Callable[[str, str], None],
+) -> None:
+    fake_platform("linux", "aarch64")
 
-    monkeypatch.setattr(platforms.importlib, "import_module", fake_import)
+    monkeypatch.setattr(platforms.importlib.util, "find_spec", lambda name: None)
 
-    with pytest.raises(ExportValidationError, match="system-site-packages"):
+    with pytest.raises(ExportValidationError, match=_SYSTEM_SITE_PACKAGES_MSG):
         preflight_for_format(ExportFormat.ENGINE)
 
 
 def test_engine_preflight_requires_tensorrt_not_tensorrt_bindings(
     monkeypatch: pytest.MonkeyPatch,
+    fake_platform: Callable[[str, str], None],
 ) -> None:
-    monkeypatch.setattr(platforms.py_platform, "system", lambda: "Linux")
-    monkeypatch.setattr(platforms.py_platform, "machine", lambda: "aarch64")
+    fake_platform("linux", "aarch64")
 
-    def fake_import(name: str) -> SimpleNamespace:
+    def fake_find_spec(name: str) -> ModuleSpec | None:
         if name == "tensorrt":
-            raise ModuleNotFoundError(name)
+            return None
         if name == "tensorrt_bindings":
-            return SimpleNamespace()
-        raise AssertionError(f"unexpected import {name}")
+            return _FAKE_SPEC
+        raise AssertionError(f"unexpected probe {name}")
 
-    monkeypatch.setattr(platforms.importlib, "import_module", fake_import)
+    monkeypatch.setattr(platforms.importlib.util, "find_spec", fake_find_spec)
 
-    with pytest.raises(ExportValidationError, match="tensorrt"):
+    with pytest.raises(ExportValidationError, match=_TENSORRT_MSG):
         preflight_for_format(ExportFormat.ENGINE)
 
 
-@pytest.mark.parametrize("missing_module", ["torch", "torchvision", "onnxruntime"])
+@pytest.mark.parametrize("missing_module", list(_RUNTIME_MODULE_MSGS))
 def test_engine_preflight_requires_jetson_runtime_modules(
     monkeypatch: pytest.MonkeyPatch,
+    fake_platform: Callable[[str, str], None],
     missing_module: str,
 ) -> None:
-    monkeypatch.setattr(platforms.py_platform, "system", lambda: "Linux")
-    monkeypatch.setattr(platforms.py_platform, "machine", lambda: "aarch64")
+    fake_platform("linux", "aarch64")
 
-    def fake_import(name: str) -> SimpleNamespace:
+    def fake_find_spec(name: str) -> ModuleSpec | None:
         if name == missing_module:
-            raise ModuleNotFoundError(name)
-        return SimpleNamespace()
+            return None
+        return _FAKE_SPEC
 
-    monkeypatch.setattr(platforms.importlib, "import_module", fake_import)
+    monkeypatch.setattr(platforms.importlib.util, "find_spec", fake_find_spec)
 
-    with pytest.raises(ExportValidationError, match=missing_module):
+    with pytest.raises(ExportValidationError, match=_RUNTIME_MODULE_MSGS[missing_module]):
         preflight_for_format(ExportFormat.ENGINE)
 
 
 def test_engine_preflight_requires_jetson_runtime_modules_happy_path(
     monkeypatch: pytest.MonkeyPatch,
+    fake_platform: Callable[[str, str], None],
 ) -> None:
-    monkeypatch.setattr(platforms.py_platform, "system", lambda: "Linux")
-    monkeypatch.setattr(platforms.py_platform, "machine", lambda: "aarch64")
-    monkeypatch.setattr(platforms.importlib, "import_module", lambda name: SimpleNamespace())
+    fake_platform("linux", "aarch64")
+    monkeypatch.setattr(platforms.importlib.util, "find_spec", lambda name: _FAKE_SPEC)
 
     result = preflight_for_format(ExportFormat.ENGINE)
     assert result.target is PlatformTarget.JETSON
     assert result.warnings == []
+
+
+def test_detect_platform_is_cached(
+    monkeypatch: pytest.MonkeyPatch, fake_platform: Callable[[str, str], None]
+) -> None:
+    fake_platform("linux", "aarch64")
+    assert detect_platform() is PlatformTarget.JETSON
+
+    monkeypatch.setattr(platforms, "_read_platform", lambda: ("linux", "x86_64"))
+    assert detect_platform() is PlatformTarget.JETSON
+
+
+@pytest.mark.parametrize(
+    ("sys_platform", "expected"),
+    [
+        pytest.param("linux", ("linux", "aarch64"), id="linux"),
+        pytest.param("darwin", ("darwin", ""), id="macos"),
+        pytest.param("win32", ("win32", ""), id="windows"),
+    ],
+)
+def test_read_platform_reads_machine_only_on_linux(
+    monkeypatch: pytest.MonkeyPatch,
+    sys_platform: str,
+    expected: tuple[str, str],
+) -> None:
+    monkeypatch.setattr(platforms.sys, "platform", sys_platform)
+    if sys_platform == "linux":
+        monkeypatch.setattr(platforms.os, "uname", lambda: SimpleNamespace(machine="aarch64"))
+    else:
+        # Windows has no os.uname(), so non-Linux hosts must never reach for it.
+        monkeypatch.delattr(platforms.os, "uname", raising=False)
+
+    assert platforms._read_platform() == expected
+
+
+def test_engine_preflight_skips_already_imported_modules(
+    monkeypatch: pytest.MonkeyPatch,
+    fake_platform: Callable[[str, str], None],
+) -> None:
+    fake_platform("linux", "aarch64")
+    for name in ("tensorrt", "torch", "torchvision", "onnxruntime"):
+        monkeypatch.setitem(platforms.sys.modules, name, ModuleType(name))
+
+    def fail_find_spec(name: str) -> ModuleSpec:
+        raise AssertionError(f"unexpected probe {name}")
+
+    monkeypatch.setattr(platforms.importlib.util, "find_spec", fail_find_spec)
+
+    result = preflight_for_format(ExportFormat.ENGINE)
+    assert result.target is PlatformTarget.JETSON
+
+
+def test_engine_preflight_is_cached_after_success(
+    monkeypatch: pytest.MonkeyPatch,
+    fake_platform: Callable[[str, str], None],
+) -> None:
+    fake_platform("linux", "aarch64")
+    probes: list[str] = []
+
+    def fake_find_spec(name: str) -> ModuleSpec | None:
+        probes.append(name)
+        return None if name == "torch" else _FAKE_SPEC
+
+    monkeypatch.setattr(platforms.importlib.util, "find_spec", fake_find_spec)
+
+    with pytest.raises(ExportValidationError, match=_RUNTIME_MODULE_MSGS["torch"]):
+        preflight_for_format(ExportFormat.ENGINE)
+    monkeypatch.setattr(platforms.importlib.util, "find_spec", lambda name: _FAKE_SPEC)
+    first = preflight_for_format(ExportFormat.ENGINE)
+    monkeypatch.setattr(platforms.importlib.util, "find_spec", lambda name: None)
+
+    second = preflight_for_format(ExportFormat.ENGINE)
+    assert second == first
+    assert second is not first
+    assert probes == ["tensorrt", "torch"]
+
+
+def test_engine_preflight_cache_can_be_bypassed_or_cleared(
+    monkeypatch: pytest.MonkeyPatch,
+    fake_platform: Callable[[str, str], None],
+) -> None:
+    fake_platform("linux", "aarch64")
+    monkeypatch.delenv(platforms.NOCACHE_ENV_VAR, raising=False)
+    monkeypatch.setattr(platforms.importlib.util, "find_spec", lambda name: _FAKE_SPEC)
+    preflight_for_format(ExportFormat.ENGINE)
+    monkeypatch.setattr(platforms.importlib.util, "find_spec", lambda name: None)
+
+    monkeypatch.setenv(platforms.NOCACHE_ENV_VAR, "1")
+    with pytest.raises(ExportValidationError, match=_TENSORRT_MSG):
+        preflight_for_format(ExportFormat.ENGINE)
+
+    monkeypatch.delenv(platforms.NOCACHE_ENV_VAR)
+    preflight_for_format(ExportFormat.ENGINE)
+    clear_preflight_cache()
+    with pytest.raises(ExportValidationError, match=_TENSORRT_MSG):
+        preflight_for_format(ExportFormat.ENGINE)